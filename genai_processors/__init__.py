@@ -17,6 +17,8 @@
 
 __version__ = '1.0.4'
 
+import typing as _typing
+
 from . import content_api as content_api_
 from . import core
 from . import processor as processor_
@@ -43,15 +45,45 @@ part_processor_function = processor_.part_processor_function
 stream_content = streams_.stream_content
 gather_stream = streams_.gather_stream
 
-# Core processors
-GenaiModel = core.genai_model.GenaiModel
-LiveModelProcessor = core.realtime.LiveModelProcessor
-LiveProcessor = core.live_model.LiveProcessor
-OllamaModel = core.ollama_model.OllamaModel
-Preamble = core.preamble.Preamble
-PyAudioIn = core.audio_io.PyAudioIn
-PyAudioOut = core.audio_io.PyAudioOut
-SpeechToText = core.speech_to_text.SpeechToText
-Suffix = core.preamble.Suffix
-TextToSpeech = core.text_to_speech.TextToSpeech
-VideoIn = core.video.VideoIn
+# Core processors. They are resolved on first access so that importing the
+# package does not import the dependencies of every core processor.
+_CORE_PROCESSORS = {
+    'GenaiModel': ('genai_model', 'GenaiModel'),
+    'LiveModelProcessor': ('realtime', 'LiveModelProcessor'),
+    'LiveProcessor': ('live_model', 'LiveProcessor'),
+    'OllamaModel': ('ollama_model', 'OllamaModel'),
+    'Preamble': ('preamble', 'Preamble'),
+    'PyAudioIn': ('audio_io', 'PyAudioIn'),
+    'PyAudioOut': ('audio_io', 'PyAudioOut'),
+    'SpeechToText': ('speech_to_text', 'SpeechToText'),
+    'Suffix': ('preamble', 'Suffix'),
+    'TextToSpeech': ('text_to_speech', 'TextToSpeech'),
+    'VideoIn': ('video', 'VideoIn'),
+}
+
+if _typing.TYPE_CHECKING:
+  # Type checkers and IDEs resolve the core processors statically.
+  GenaiModel = core.genai_model.GenaiModel
+  LiveModelProcessor = core.realtime.LiveModelProcessor
+  LiveProcessor = core.live_model.LiveProcessor
+  OllamaModel = core.ollama_model.OllamaModel
+  Preamble = core.preamble.Preamble
+  PyAudioIn = core.audio_io.PyAudioIn
+  PyAudioOut = core.audio_io.PyAudioOut
+  SpeechToText = core.speech_to_text.SpeechToText
+  Suffix = core.preamble.Suffix
+  TextToSpeech = core.text_to_speech.TextToSpeech
+  VideoIn = core.video.VideoIn
+
+
+def __getattr__(name: str) -> _typing.Any:
+  if name in _CORE_PROCESSORS:
+    module_name, attr_name = _CORE_PROCESSORS[name]
+    value = getattr(getattr(core, module_name), attr_name)
+    globals()[name] = value
+    return value
+  raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__() -> list[str]:
+  return sorted(set(globals()) | set(_CORE_PROCESSORS))
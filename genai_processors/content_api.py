@@ -388,11 +388,15 @@ class ProcessorPart:
   @classmethod
   def from_dataclass(cls, *, dataclass: Any, **kwargs) -> 'ProcessorPart':
     """Constructs a ProcessorPart from a dataclass."""
-    part = ProcessorPart(
-        json.dumps(dataclasses.asdict(dataclass)),
-        mimetype=f'application/json; type={type(dataclass).__name__}',
+    # Build the part in one go: this is called for every URL extracted by
+    # text.UrlExtractor.
+    mimetype = (
+        kwargs.pop('mimetype', None)
+        or f'application/json; type={type(dataclass).__name__}'
+    )
+    return cls(
+        json.dumps(dataclasses.asdict(dataclass)), mimetype=mimetype, **kwargs
     )
-    return cls(part, **kwargs)
 
   @classmethod
   def from_dict(cls, *, data: dict[str, Any]) -> 'ProcessorPart':
@@ -663,6 +667,24 @@ def group_by_mimetype(content: ProcessorContent) -> dict[str, ProcessorContent]:
   return grouped_content
 
 
+def _iter_parts(content: ProcessorContentTypes) -> Iterable[ProcessorPart]:
+  """Returns an iterable over the parts of `content`.
+
+  Content that already consists of ProcessorParts is returned as is instead of
+  being copied into a new ProcessorContent, which would copy every part. Such
+  parts are yielded as the caller's own objects, not copies.
+  """
+  if isinstance(content, ProcessorPart):
+    return (content,)
+  if isinstance(content, (list, tuple)) and all(
+      isinstance(part, ProcessorPart) for part in content
+  ):
+    return content
+  if not isinstance(content, ProcessorContent):
+    content = ProcessorContent(content)
+  return content.all_parts
+
+
 # Functions that reduce ProcessorContent to well known formats.
 def as_text(
     content: ProcessorContentTypes,
@@ -683,9 +705,10 @@ def as_text(
       be returned.
   """
   text_parts = []
-  for mime, part in ProcessorContent(content).items():
+  for part in _iter_parts(content):
     if substream_name is not None and part.substream_name != substream_name:
       continue
+    mime = part.mimetype
     if is_text(mime):
       text_parts.append(part.text)
     elif strict:
@@ -719,7 +742,8 @@ def as_text_with_reasoning(
   """
   text_parts = []
   thought_parts = []
-  for mime, p in ProcessorContent(content).items():
+  for p in _iter_parts(content):
+    mime = p.mimetype
     if is_text(mime):
       if p.part.thought:
         thought_parts.append(p.text)
@@ -737,14 +761,8 @@ def _as_format_helper(
     ignore_unsupported_types: bool,
 ) -> list[ProcessorPart]:
   """Helper function to extract parts from the content based on MIME type."""
-  if isinstance(content, ProcessorPart):
-    # Fast path for singular parts.
-    content = [content]
-  elif not isinstance(content, ProcessorContent):
-    content = ProcessorContent(content)
-
   parts = []
-  for p in content:
+  for p in _iter_parts(content):
     if mime_check(p.mimetype):
       parts.append(p)
     elif not ignore_unsupported_types:
@@ -763,7 +781,8 @@ def as_images(
       ValueError would be risen. This argument allows to ignore such parts.
 
   Returns:
-    A list of image parts, with the same order as in the input content.
+    A list of image parts, with the same order as in the input content. Input
+    ProcessorParts are returned as is, not copied.
   """
   return _as_format_helper(
       content, mime_types.is_image, ignore_unsupported_types
@@ -781,7 +800,7 @@ def as_videos(
       ValueError would be raised. This argument allows ingoring such parts.
 
   Returns:
-    A list of video parts.
+    A list of video parts. Input ProcessorParts are returned as is, not copied.
   """
   return _as_format_helper(
       content, lambda mime: mime.startswith('video/'), ignore_unsupported_types
@@ -68,6 +68,7 @@ from typing import Any
 
 from genai_processors import content_api
 from genai_processors import processor
+from genai_processors import streams
 from genai_processors import tool_utils
 from google.genai import types as genai_types
 import httpx
@@ -183,21 +184,22 @@ def _to_openrouter_message(
   raise ValueError(f'Unsupported Part type: {part.mimetype}')
 
 
-def _parse_sse_line(line: str) -> dict[str, Any] | None:
+def _parse_sse_line(line: bytes) -> dict[str, Any] | None:
   """Parse a Server-Sent Events line."""
   line = line.strip()
 
   # Skip comments and empty lines.
-  if not line or line.startswith(':'):
+  if not line or line.startswith(b':'):
     return None
 
   # Parse data lines.
-  if line.startswith('data: '):
+  if line.startswith(b'data: '):
     data = line[6:]
-    if data == '[DONE]':
+    if data == b'[DONE]':
       return {'type': 'done'}
 
-    # Let JSON errors propagate - don't suppress them.
+    # Let JSON errors propagate - don't suppress them. json.loads accepts
+    # UTF-8 bytes directly, so the payload is never decoded to str first.
     return json.loads(data)
 
   return None
@@ -363,7 +365,7 @@ class OpenRouterModel(processor.Processor):
       # Buffer for accumulating function calls across streaming chunks.
       accumulated_function_call = {'name': '', 'arguments': ''}
 
-      async for line in response.aiter_lines():
+      async for line in streams.split_lines(response.aiter_bytes()):
         parsed = _parse_sse_line(line)
         if not parsed:
           continue
@@ -15,6 +15,7 @@
 
 """Tests for OpenRouter model processor."""
 
+from collections.abc import Callable
 import enum
 import http
 import json
@@ -36,6 +37,28 @@ class ResponseEnum(enum.StrEnum):
 
 class OpenRouterModelTest(parameterized.TestCase):
 
+  @classmethod
+  def setUpClass(cls):
+    super().setUpClass()
+    # Headers matching what OpenRouterModel sets for the default config.
+    cls._base_headers = {
+        'Authorization': 'Bearer test-api-key',
+        'Content-Type': 'application/json',
+        'User-Agent': 'genai-processors',
+    }
+
+  def _make_client(
+      self,
+      request_handler: Callable[[httpx.Request], httpx.Response],
+      extra_headers: dict[str, str] | None = None,
+  ) -> httpx.AsyncClient:
+    """Returns a client that serves requests with `request_handler`."""
+    return httpx.AsyncClient(
+        transport=httpx.MockTransport(request_handler),
+        base_url='https://openrouter.ai/api/v1',
+        headers={**self._base_headers, **(extra_headers or {})},
+    )
+
   def test_basic_inference(self):
     def request_handler(request: httpx.Request):
       self.assertEqual(
@@ -73,16 +96,7 @@ class OpenRouterModelTest(parameterized.TestCase):
           http.HTTPStatus.OK, content='\n'.join(response_lines).encode('utf-8')
       )
 
-    # Mock client with proper headers that match what OpenRouter model sets.
-    mock_client = httpx.AsyncClient(
-        transport=httpx.MockTransport(request_handler),
-        base_url='https://openrouter.ai/api/v1',
-        headers={
-            'Authorization': 'Bearer test-api-key',
-            'Content-Type': 'application/json',
-            'User-Agent': 'genai-processors',
-        },
-    )
+    mock_client = self._make_client(request_handler)
 
     with mock.patch.object(httpx, 'AsyncClient', return_value=mock_client):
       model = openrouter_model.OpenRouterModel(
@@ -117,16 +131,9 @@ class OpenRouterModelTest(parameterized.TestCase):
       )
 
     # Mock client with site-specific headers.
-    mock_client = httpx.AsyncClient(
-        transport=httpx.MockTransport(request_handler),
-        base_url='https://openrouter.ai/api/v1',
-        headers={
-            'Authorization': 'Bearer test-api-key',
-            'Content-Type': 'application/json',
-            'User-Agent': 'genai-processors',
-            'HTTP-Referer': 'https://mysite.com',
-            'X-Title': 'My App',
-        },
+    mock_client = self._make_client(
+        request_handler,
+        {'HTTP-Referer': 'https://mysite.com', 'X-Title': 'My App'},
     )
 
     with mock.patch.object(httpx, 'AsyncClient', return_value=mock_client):
@@ -153,15 +160,7 @@ class OpenRouterModelTest(parameterized.TestCase):
           http.HTTPStatus.OK, content='\n'.join(response_lines).encode('utf-8')
       )
 
-    mock_client = httpx.AsyncClient(
-        transport=httpx.MockTransport(request_handler),
-        base_url='https://openrouter.ai/api/v1',
-        headers={
-            'Authorization': 'Bearer test-api-key',
-            'Content-Type': 'application/json',
-            'User-Agent': 'genai-processors',
-        },
-    )
+    mock_client = self._make_client(request_handler)
 
     with mock.patch.object(httpx, 'AsyncClient', return_value=mock_client):
       model = openrouter_model.OpenRouterModel(
@@ -193,15 +192,7 @@ class OpenRouterModelTest(parameterized.TestCase):
           http.HTTPStatus.OK, content='\n'.join(response_lines).encode('utf-8')
       )
 
-    mock_client = httpx.AsyncClient(
-        transport=httpx.MockTransport(request_handler),
-        base_url='https://openrouter.ai/api/v1',
-        headers={
-            'Authorization': 'Bearer test-api-key',
-            'Content-Type': 'application/json',
-            'User-Agent': 'genai-processors',
-        },
-    )
+    mock_client = self._make_client(request_handler)
 
     with mock.patch.object(httpx, 'AsyncClient', return_value=mock_client):
       model = openrouter_model.OpenRouterModel(
@@ -254,15 +245,7 @@ class OpenRouterModelTest(parameterized.TestCase):
           http.HTTPStatus.OK, content='\n'.join(response_lines).encode('utf-8')
       )
 
-    mock_client = httpx.AsyncClient(
-        transport=httpx.MockTransport(request_handler),
-        base_url='https://openrouter.ai/api/v1',
-        headers={
-            'Authorization': 'Bearer test-api-key',
-            'Content-Type': 'application/json',
-            'User-Agent': 'genai-processors',
-        },
-    )
+    mock_client = self._make_client(request_handler)
 
     with mock.patch.object(httpx, 'AsyncClient', return_value=mock_client):
       weather_tool = genai_types.Tool(
@@ -348,15 +331,7 @@ class OpenRouterModelTest(parameterized.TestCase):
           http.HTTPStatus.OK, content='\n'.join(response_lines).encode('utf-8')
       )
 
-    mock_client = httpx.AsyncClient(
-        transport=httpx.MockTransport(request_handler),
-        base_url='https://openrouter.ai/api/v1',
-        headers={
-            'Authorization': 'Bearer test-api-key',
-            'Content-Type': 'application/json',
-            'User-Agent': 'genai-processors',
-        },
-    )
+    mock_client = self._make_client(request_handler)
 
     with mock.patch.object(httpx, 'AsyncClient', return_value=mock_client):
       model = openrouter_model.OpenRouterModel(
@@ -382,14 +357,8 @@ class OpenRouterModelTest(parameterized.TestCase):
           content=json.dumps(error_response).encode('utf-8'),
       )
 
-    mock_client = httpx.AsyncClient(
-        transport=httpx.MockTransport(request_handler),
-        base_url='https://openrouter.ai/api/v1',
-        headers={
-            'Authorization': 'Bearer invalid-key',
-            'Content-Type': 'application/json',
-            'User-Agent': 'genai-processors',
-        },
+    mock_client = self._make_client(
+        request_handler, {'Authorization': 'Bearer invalid-key'}
     )
 
     with mock.patch.object(httpx, 'AsyncClient', return_value=mock_client):
@@ -403,6 +372,38 @@ class OpenRouterModelTest(parameterized.TestCase):
 
       self.assertIn('Invalid API key', str(context.exception))
 
+  def test_sse_events_split_across_chunks(self):
+    body = (
+        b': keep-alive\r\n\r\n'
+        b'data: {"choices": [{"delta": {"content": "caf\xc3\xa9"},'
+        b' "finish_reason": null}]}\r\n\r\n'
+        b'data: {"choices": [{"delta": {"content": " ol\xc3\xa9"},'
+        b' "finish_reason": "stop"}]}\n\n'
+        b'data: [DONE]\n\n'
+    )
+
+    async def body_chunks():
+      # Split the body at every 7 bytes, including in the middle of multi-byte
+      # UTF-8 sequences and of the newline separators.
+      for i in range(0, len(body), 7):
+        yield body[i : i + 7]
+
+    def request_handler(request: httpx.Request):
+      del request  # Unused.
+      return httpx.Response(http.HTTPStatus.OK, content=body_chunks())
+
+    mock_client = self._make_client(request_handler)
+
+    with mock.patch.object(httpx, 'AsyncClient', return_value=mock_client):
+      model = openrouter_model.OpenRouterModel(
+          api_key='test-api-key',
+          model_name='test-model',
+      )
+      output = processor.apply_sync(model, ['test'])
+
+    self.assertEqual(content_api.as_text(output), 'café olé')
+    self.assertEqual(output[-1].metadata['finish_reason'], 'stop')
+
 
 if __name__ == '__main__':
   unittest.main()
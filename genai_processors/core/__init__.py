@@ -12,22 +12,68 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-"""Core processors."""
-
-from . import audio_io
-from . import drive
-from . import event_detection
-from . import genai_model
-from . import github
-from . import jinja_template
-from . import live_model
-from . import ollama_model
-from . import pdf
-from . import preamble
-from . import rate_limit_audio
-from . import realtime
-from . import speech_to_text
-from . import text
-from . import text_to_speech
-from . import timestamp
-from . import video
+"""Core processors.
+
+Submodules are imported lazily, on first attribute access, as several of them
+depend on heavy or native packages (e.g. pyaudio, opencv, pypdfium2) that are
+not needed by programs using a single processor. Both
+`from genai_processors.core import text` and `core.text` keep working.
+"""
+
+import importlib as _importlib
+import typing as _typing
+
+if _typing.TYPE_CHECKING:
+  # Type checkers and IDEs resolve the submodules statically.
+  from . import audio_io
+  from . import drive
+  from . import event_detection
+  from . import genai_model
+  from . import github
+  from . import jinja_template
+  from . import live_model
+  from . import ollama_model
+  from . import pdf
+  from . import preamble
+  from . import rate_limit_audio
+  from . import realtime
+  from . import speech_to_text
+  from . import text
+  from . import text_to_speech
+  from . import timestamp
+  from . import video
+
+_SUBMODULES = frozenset({
+    'audio_io',
+    'drive',
+    'event_detection',
+    'genai_model',
+    'github',
+    'jinja_template',
+    'live_model',
+    'ollama_model',
+    'pdf',
+    'preamble',
+    'rate_limit_audio',
+    'realtime',
+    'speech_to_text',
+    'text',
+    'text_to_speech',
+    'timestamp',
+    'video',
+})
+
+__all__ = sorted(_SUBMODULES)
+
+
+def __getattr__(name: str) -> _typing.Any:
+  if name in _SUBMODULES:
+    module = _importlib.import_module(f'.{name}', __name__)
+    # Cache the module so that __getattr__ is not called again for it.
+    globals()[name] = module
+    return module
+  raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__() -> list[str]:
+  return sorted(set(globals()) | _SUBMODULES)
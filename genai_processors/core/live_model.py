@@ -251,7 +251,9 @@ class LiveProcessor(processor.Processor):
         try:
           while True:
             async for response in session.receive():
-              if not (
+              # Stringifying the response is costly: only do it when the log
+              # will be emitted.
+              if logging.level_debug() and not (
                   response.server_content
                   and response.server_content.model_turn
                   and response.server_content.model_turn.parts
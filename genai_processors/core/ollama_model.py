@@ -37,6 +37,7 @@ from typing import Any, Literal
 from genai_processors import content_api
 from genai_processors import mime_types
 from genai_processors import processor
+from genai_processors import streams
 from genai_processors import tool_utils
 from google.genai import types as genai_types
 import httpx
@@ -233,7 +234,9 @@ class OllamaModel(processor.Processor):
             f'{e}: {r.json()["error"]}', request=e.request, response=e.response
         )
 
-      async for line in r.aiter_lines():
+      async for line in streams.split_lines(r.aiter_bytes()):
+        if not (line := line.strip()):
+          continue
         part = json.loads(line)
         if err := part.get('error'):
           raise RuntimeError(err)
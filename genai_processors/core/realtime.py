@@ -179,7 +179,7 @@ class _RollingPrompt:
 
   def _cut_conversation_history(self):
     """Removes old parts from the conversation history."""
-    if not self._conversation_history:
+    if not self._conversation_history or self._duration_prompt_sec is None:
       return
     time_cut_point = time.perf_counter() - self._duration_prompt_sec
     while (
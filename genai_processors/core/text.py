@@ -229,6 +229,13 @@ class MatchProcessor(processor.Processor):
       self, content: AsyncIterable[content_api.ProcessorPart]
   ) -> AsyncIterable[content_api.ProcessorPartTypes]:
     part_buffer = []
+    # Concatenation of the input text parts in part_buffer. It is extended as
+    # parts come in and only recomputed when parts leave the buffer, so that
+    # long buffered prefixes are not re-joined for every new part.
+    text_buffer = ''
+    # Whether word_start is in text_buffer. Only the newly appended text needs
+    # to be searched for it, which keeps the check cheap on long buffers.
+    word_start_found = False
     async for part in content:
       if not self._remove_from_input_stream:
         yield part
@@ -238,14 +245,25 @@ class MatchProcessor(processor.Processor):
           for part_b in part_buffer:
             yield part_b
         part_buffer = []
-      text_buffer = content_api.as_text(
-          part_buffer, substream_name=self._substream_input
-      )
+        text_buffer = ''
+        word_start_found = False
+      elif (
+          part.substream_name == self._substream_input
+          and content_api.is_text(part.mimetype)
+      ):
+        search_start = len(text_buffer)
+        text_buffer += part.text
+        if self._word_start is not None and not word_start_found:
+          # word_start can straddle the previous and the new text.
+          search_start = max(0, search_start - len(self._word_start) + 1)
+          word_start_found = (
+              text_buffer.find(self._word_start, search_start) != -1
+          )
       # If the word_start is not in the buffer, we can already yield all the
       # parts up to the last ones that could contain word_start.
       # This is a quick check to avoid buffering more than necessary.
       # Only applies when word_start is set.
-      if self._word_start is not None and self._word_start not in text_buffer:
+      if self._word_start is not None and not word_start_found:
         offset = 0
         idx = 0  # index of first part not yielded.
         for c in part_buffer:
@@ -265,18 +283,38 @@ class MatchProcessor(processor.Processor):
             idx += 1
           else:
             break
-        part_buffer = part_buffer[idx:]
+        if idx:
+          # The remaining text is a suffix of text_buffer, so it does not
+          # contain word_start either.
+          part_buffer = part_buffer[idx:]
+          text_buffer = content_api.as_text(
+              part_buffer, substream_name=self._substream_input
+          )
       else:
-        to_yield, part_buffer = self._extract_part(text_buffer, part_buffer)
+        to_yield, remaining = self._extract_part(text_buffer, part_buffer)
+        if remaining is not part_buffer:
+          part_buffer = remaining
+          text_buffer = content_api.as_text(
+              part_buffer, substream_name=self._substream_input
+          )
+          word_start_found = (
+              self._word_start is not None and self._word_start in text_buffer
+          )
         for part in to_yield:
           yield part
 
-    # Process the last part which can contain the pattern many times.
+    # Process the last part which can contain the pattern many times. Only
+    # iterations that do not consume any text count towards _MAX_LOOP_COUNT,
+    # e.g. when the pattern matches the empty string.
     loop_count = 0
+    text_len = None
     while part_buffer and loop_count < _MAX_LOOP_COUNT:
       text_buffer = content_api.as_text(
           part_buffer, substream_name=self._substream_input
       )
+      if text_len is not None and len(text_buffer) >= text_len:
+        loop_count += 1
+      text_len = len(text_buffer)
       to_yield, part_buffer = self._extract_part(text_buffer, part_buffer)
       if not to_yield:
         # No match found, we can yield all the parts.
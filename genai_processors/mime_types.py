@@ -115,12 +115,19 @@ ALL_SUPPORTED_INPUT_TYPES = (
     INPUT_IMAGE_TYPES + INPUT_AUDIO_TYPES + INPUT_VIDEO_TYPES + INPUT_TEXT_TYPES
 )
 
+# Set versions of the lists above for constant time lookups: the is_* checks
+# below run for every part flowing through a processor.
+_INPUT_IMAGE_TYPES = frozenset(INPUT_IMAGE_TYPES)
+_INPUT_AUDIO_TYPES = frozenset(INPUT_AUDIO_TYPES)
+_INPUT_VIDEO_TYPES = frozenset(INPUT_VIDEO_TYPES)
+_INPUT_TEXT_TYPES = frozenset(INPUT_TEXT_TYPES)
+
 TEXT_EXCEPTION = 'text/x-exception'
 
 
 def is_text(mime: str) -> bool:
   """Returns whether the content is a human-readable text."""
-  return mime in INPUT_TEXT_TYPES or mime.startswith('text/')
+  return mime in _INPUT_TEXT_TYPES or mime.startswith('text/')
 
 
 def is_json(mime: str) -> bool:
@@ -136,7 +143,7 @@ def is_dataclass(mime: str, json_dataclass: type[Any] | None = None) -> bool:
 
 def is_image(mime: str) -> bool:
   """Returns whether the content is an image."""
-  return (mime in INPUT_IMAGE_TYPES) or mime.startswith('image/')
+  return (mime in _INPUT_IMAGE_TYPES) or mime.startswith('image/')
 
 
 def is_video(mime: str) -> bool:
@@ -148,12 +155,12 @@ def is_video(mime: str) -> bool:
   Returns:
     True of it is a video, False otherwise.
   """
-  return (mime in INPUT_VIDEO_TYPES) or mime.startswith('video/')
+  return (mime in _INPUT_VIDEO_TYPES) or mime.startswith('video/')
 
 
 def is_audio(mime: str) -> bool:
   """Returns whether the content is audio."""
-  return (mime in INPUT_AUDIO_TYPES) or mime.startswith('audio/')
+  return (mime in _INPUT_AUDIO_TYPES) or mime.startswith('audio/')
 
 
 def is_streaming_audio(mime: str) -> bool:
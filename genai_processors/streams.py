@@ -190,10 +190,17 @@ async def dequeue(queue: asyncio.Queue[_T | None]) -> AsyncIterable[_T]:
     The content from the queue as an AsyncIterable. The items are yielded in
     the order they were enqueued.
   """
-  while (part := await queue.get()) is not None:
+  while True:
+    # Drain already queued items without creating a coroutine per item, only
+    # awaiting when the queue is empty.
+    try:
+      part = queue.get_nowait()
+    except asyncio.QueueEmpty:
+      part = await queue.get()
     queue.task_done()
+    if part is None:
+      return
     yield part
-  queue.task_done()
 
 
 async def stream_content(
@@ -244,6 +251,31 @@ async def aenumerate(
     i += 1
 
 
+async def split_lines(chunks: AsyncIterable[bytes]) -> AsyncIterable[bytes]:
+  """Splits a stream of byte chunks into lines, without decoding them.
+
+  Lines can span several chunks. The newline is dropped, but any other
+  whitespace, such as a carriage return, is kept. A last line without a
+  trailing newline is yielded as well.
+
+  Args:
+    chunks: the byte chunks to split, e.g. an HTTP response body.
+
+  Yields:
+    each line of the concatenated chunks.
+  """
+  buffer = bytearray()
+  async for chunk in chunks:
+    buffer += chunk
+    start = 0
+    while (end := buffer.find(b'\n', start)) != -1:
+      yield bytes(buffer[start:end])
+      start = end + 1
+    del buffer[:start]
+  if buffer:
+    yield bytes(buffer)
+
+
 async def endless_stream() -> AsyncIterable[Any]:
   """Empty input stream for the live agents.
 
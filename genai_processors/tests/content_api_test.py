@@ -129,6 +129,22 @@ class ProcessorContentTest(parameterized.TestCase):
     )
     self.assertEqual(content_api.as_text(content), 'foo:bar:bazbar')
 
+  def test_as_text_mixed_inputs(self):
+    image_part = content_api.ProcessorPart(
+        b'\x00', mimetype='image/png', substream_name='foo'
+    )
+    parts = [
+        content_api.ProcessorPart('foo:', substream_name='foo'),
+        image_part,
+        content_api.ProcessorPart('bar', substream_name='foo'),
+    ]
+    self.assertEqual(content_api.as_text(parts), 'foo:bar')
+    self.assertEqual(content_api.as_text(tuple(parts)), 'foo:bar')
+    self.assertEqual(content_api.as_text(parts[0]), 'foo:')
+    self.assertEqual(content_api.as_text(['foo:', *parts[1:]]), 'foo:bar')
+    with self.assertRaises(ValueError):
+      content_api.as_text(parts, strict=True)
+
   def test_metadata(self):
     content = content_api.ProcessorContent([
         content_api.ProcessorPart(
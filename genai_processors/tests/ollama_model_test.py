@@ -46,13 +46,17 @@ class OllamaProcessorTest(parameterized.TestCase):
       )
 
       response = (
-          '{"message": {"content": "O", "role": "model"}}\n'
-          '{"message": {"content": "K", "role": "model"}}\n'
-      )
-      return httpx.Response(
-          http.HTTPStatus.OK, content=response.encode('utf-8')
+          b'{"message": {"content": "O", "role": "model"}}\n'
+          b'{"message": {"content": "K", "role": "model"}}\n'
       )
 
+      async def response_chunks():
+        # Stream the body in chunks that do not align with line boundaries.
+        for i in range(0, len(response), 10):
+          yield response[i : i + 10]
+
+      return httpx.Response(http.HTTPStatus.OK, content=response_chunks())
+
     mock_client = httpx.AsyncClient(
         transport=httpx.MockTransport(request_handler)
     )
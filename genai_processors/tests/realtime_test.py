@@ -1,6 +1,7 @@
 import asyncio
 from collections.abc import AsyncIterable
 import unittest
+from unittest import mock
 
 from absl.testing import parameterized
 from genai_processors import content_api
@@ -126,11 +127,15 @@ class RealTimeConversationModelTest(unittest.IsolatedAsyncioTestCase):
     self.user_not_talking.set()
     self.rolling_prompt = realtime._RollingPrompt()
 
-  def end_conversation(self):
-    # To be called within an asyncio loop.
+  def end_conversation(self, model: realtime._RealTimeConversationModel):
+    # To be called within an asyncio loop, after model.turn().
     async def _end_conversation():
-      await asyncio.sleep(5)
-      self.output_queue.put_nowait(None)
+      # Wait for the model turn to be output and added to the prompt. The
+      # conversation is ended even if the turn fails, so the test cannot hang.
+      try:
+        await model._current_generate_output
+      finally:
+        self.output_queue.put_nowait(None)
 
     processor.create_task(_end_conversation())
 
@@ -148,7 +153,7 @@ class RealTimeConversationModelTest(unittest.IsolatedAsyncioTestCase):
     model.turn()
     model.user_input(ProcessorPart('done', role='user'))
 
-    self.end_conversation()
+    self.end_conversation(model)
     output_parts = await streams.gather_stream(
         streams.dequeue(self.output_queue)
     )
@@ -168,7 +173,7 @@ class RealTimeConversationModelTest(unittest.IsolatedAsyncioTestCase):
     model.turn()
 
     # Wait for the conversation to end.
-    self.end_conversation()
+    self.end_conversation(model)
     _ = await streams.gather_stream(streams.dequeue(self.output_queue))
 
     # Check that the rolling prompt put all the parts in the correct order.
@@ -215,7 +220,11 @@ class RealTimePromptTest(unittest.IsolatedAsyncioTestCase):
     # -> part while outputting should always be put at the end.
     self.assertEqual(prompt_text, '0123401234while_outputting')
 
-  async def test_cut_history(self):
+  @mock.patch.object(realtime, 'time')
+  async def test_cut_history(self, mock_time):
+    # Fake clock, advanced explicitly instead of sleeping.
+    now_sec = 0.0
+    mock_time.perf_counter.side_effect = lambda: now_sec
     rolling_prompt = realtime._RollingPrompt(duration_prompt_sec=0.1)
     prompt_content = rolling_prompt.pending()
     part_count = 2
@@ -224,7 +233,7 @@ class RealTimePromptTest(unittest.IsolatedAsyncioTestCase):
     for idx, part in enumerate(part_list):
       rolling_prompt.add_part(part)
       rolling_prompt.add_part(img_list[idx])
-      await asyncio.sleep(0.01)
+      now_sec += 0.01
     rolling_prompt.finalize_pending()
     prompt_text = [
         content_api.as_text(c) if content_api.is_text(c.mimetype) else 'img'
@@ -232,7 +241,7 @@ class RealTimePromptTest(unittest.IsolatedAsyncioTestCase):
     ]
     # First prompt gets the full history.
     self.assertEqual(prompt_text, ['0', 'img', '1', 'img'])
-    await asyncio.sleep(0.08)
+    now_sec += 0.085
     rolling_prompt.finalize_pending()
     prompt_content = rolling_prompt.pending()
     for part in part_list:
@@ -245,6 +254,18 @@ class RealTimePromptTest(unittest.IsolatedAsyncioTestCase):
     # Second prompt gets the cut history + what was fed now.
     self.assertEqual(prompt_text, ['1', 'img', '0', '1'])
 
+  async def test_keep_full_history(self):
+    rolling_prompt = realtime._RollingPrompt(duration_prompt_sec=None)
+    rolling_prompt.add_part(ProcessorPart('0'))
+    rolling_prompt.finalize_pending()
+    prompt_content = rolling_prompt.pending()
+    rolling_prompt.add_part(ProcessorPart('1'))
+    rolling_prompt.finalize_pending()
+    prompt_text = ProcessorContent(
+        await streams.gather_stream(prompt_content)
+    ).as_text()
+    self.assertEqual(prompt_text, '01')
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -117,6 +117,11 @@ class StreamsTest(parameterized.TestCase, unittest.IsolatedAsyncioTestCase):
     async for i, x in streams.aenumerate(as_stream):
       self.assertEqual(i + 1, x)
 
+  async def test_split_lines(self):
+    chunks = streams.stream_content([b'a\r', b'\nbc', b'\n\n', b'd'])
+    lines = await streams.gather_stream(streams.split_lines(chunks))
+    self.assertEqual(lines, [b'a\r', b'bc', b'', b'd'])
+
   async def test_finishes(self):
 
     async def slow_noop(
@@ -198,6 +198,24 @@ class MatchProcessorTest(parameterized.TestCase):
         ),
     )
 
+  def test_empty_match_raises_after_max_loop_count(self):
+    # An empty match leaves the buffer unchanged, so the final loop over the
+    # buffer can never make progress.
+    extractor = text.MatchProcessor(pattern=r'x*')
+    with self.assertRaisesRegex(RuntimeError, 'Max loop count reached'):
+      processor.apply_sync(extractor, ['ab'])
+
+  def test_many_matches_in_last_part(self):
+    extractor = text.MatchProcessor(
+        pattern=r'\[e:[^\]]*\]',
+        word_start='[e:',
+        substream_output='e',
+    )
+    output = processor.apply_sync(extractor, ['[e:1] ' * 1200])
+    matches = [p.text for p in output if p.substream_name == 'e']
+    self.assertLen(matches, 1200)
+    self.assertEqual(matches[-1], '[e:1]')
+
   def test_split_parts_ok(self):
     extractor = text.MatchProcessor(
         word_start=r'[event query:',
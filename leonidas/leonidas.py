@@ -130,6 +130,18 @@ MAX_SILENCE_WAIT_FOR_USER_SEC = 5
 # used when a comment is blocked because of chattiness.
 NO_COMMENT_DELAY_SEC = 3
 
+# Minimum number of seconds between two debug logs of no-op state transitions
+# caused by streamed media parts. All such transitions share one rate limiter,
+# whatever the state they happen in.
+DUPLICATE_LOG_INTERVAL_SEC = 5
+
+# Number of seconds between two logs of the commentator running time.
+STATUS_LOG_INTERVAL_SEC = 10
+
+# Number of recent time to first token (TTFT) measurements used to predict the
+# next TTFT.
+TTFT_HISTORY_MAX_LEN = 50
+
 # User message when the agent detects it should continue commentating.
 COMMENT_MSG = (
     'Continue a análise do que você vê, sem repetir os mesmos comentários.'
@@ -167,6 +179,18 @@ START_AGAIN_MSG = (
     ' estava dizendo?'
 )
 
+# Names of the async functions declared to the model.
+START_COMMENTATING_FN = 'start_commentating'
+WAIT_FOR_USER_FN = 'wait_for_user'
+
+# Scheduling of the async function responses sent to the model.
+# SILENT: answers the call without triggering a model generation.
+_SILENT = genai_types.FunctionResponseScheduling.SILENT
+# WHEN_IDLE: triggers a generation once the current one is done.
+_WHEN_IDLE = genai_types.FunctionResponseScheduling.WHEN_IDLE
+# INTERRUPT: stops the current generation and starts a new one.
+_INTERRUPT = genai_types.FunctionResponseScheduling.INTERRUPT
+
 # Async function declarations.
 TOOLS = [
     genai_types.Tool(
@@ -178,7 +202,7 @@ TOOLS = [
             # `scheduling` field in the function response) and to make the model
             # include the latest observations in its prompt before generation.
             genai_types.FunctionDeclaration(
-                name='start_commentating',
+                name=START_COMMENTATING_FN,
                 description=(
                     'Starts commentating on the video feed. The model should'
                     ' continue commentating until the user asks to stop. Caller'
@@ -192,7 +216,7 @@ TOOLS = [
     genai_types.Tool(
         function_declarations=[
             genai_types.FunctionDeclaration(
-                name='wait_for_user',
+                name=WAIT_FOR_USER_FN,
                 description=(
                     'Waits for the user to respond to your question or to do'
                     ' something special on the video stream, e.g. user picks up'
@@ -280,6 +304,31 @@ EVENT_DETECTION_PROMPT = (
     f"Em todos os outros casos, responda com '{EventTypes.NO_DETECTION}'.\n"
 )
 
+# The configs below do not depend on the agent arguments. They are built once
+# so that recreating the agent (e.g. on RESET from AI Studio) does not validate
+# the same pydantic models again.
+_EVENT_DETECTION_CONFIG = genai_types.GenerateContentConfig(
+    system_instruction=EVENT_DETECTION_PROMPT,
+    max_output_tokens=10,
+    response_mime_type='text/x.enum',
+    response_schema=EventTypes,
+    media_resolution=MEDIA_RESOLUTION,
+)
+
+_LIVE_CONNECT_CONFIG = genai_types.LiveConnectConfig(
+    tools=TOOLS,
+    system_instruction=LEONIDAS_PROMPT_PARTS,
+    output_audio_transcription={},
+    realtime_input_config=genai_types.RealtimeInputConfig(
+        turn_coverage='TURN_INCLUDES_ALL_INPUT'
+    ),
+    response_modalities=['AUDIO'],
+    speech_config={'language_code': 'pt-BR'},
+    generation_config=genai_types.GenerationConfig(
+        media_resolution=MEDIA_RESOLUTION
+    ),
+)
+
 
 def audio_duration_sec(audio_data: bytes, sample_rate: int) -> float:
   """Returns the duration of the audio data in seconds."""
@@ -398,6 +447,10 @@ class Action(enum.Enum):
   WAIT_FOR_USER = 8
 
 
+def _new_ttft_history() -> collections.deque[float]:
+  return collections.deque(maxlen=TTFT_HISTORY_MAX_LEN)
+
+
 @dataclasses.dataclass
 class CommentatorStateMachine:
   """(state, action) -> state transitions for the commentator."""
@@ -406,8 +459,10 @@ class CommentatorStateMachine:
   state: State = State.OFF
   # Generation requests currently in progress, aka active.
   generation_request_info: Optional[GenerationRequestInfo] = None
+  # Historic time to first token (TTFT) of the recent requests. We use it to
+  # request the next comment just before the current one finishes.
   ttfts: collections.deque[float] = dataclasses.field(
-      default_factory=collections.deque
+      default_factory=_new_ttft_history
   )
   # Commentator ID, defined by the Async Fn call that triggered the commentator.
   id: Optional[str] = None
@@ -472,13 +527,30 @@ class CommentatorStateMachine:
           if self.state != State.WAITING_FOR_USER:
             self.state = State.TALKING
     finally:
-      logging.debug(
-          '%s - Update: %s + %s -> %s',
-          time.perf_counter(),
-          start_state,
-          action,
-          self.state,
-      )
+      if action == Action.STREAM_MEDIA_PART and start_state == self.state:
+        # Media parts arrive many times per second and mostly leave the state
+        # unchanged: only log these no-op transitions every few seconds. absl
+        # rate-limits per call site, so a no-op transition in one state also
+        # silences those in any other state for that interval. The level is
+        # checked first to skip the call site lookup done by absl.
+        if logging.level_debug():
+          logging.log_every_n_seconds(
+              logging.DEBUG,
+              '%s - Update: %s + %s -> %s',
+              DUPLICATE_LOG_INTERVAL_SEC,
+              time.perf_counter(),
+              start_state,
+              action,
+              self.state,
+          )
+      else:
+        logging.debug(
+            '%s - Update: %s + %s -> %s',
+            time.perf_counter(),
+            start_state,
+            action,
+            self.state,
+        )
 
   def mark_start_generation(self, generation_type: GenerationType):
     logging.debug(
@@ -507,8 +579,10 @@ class CommentatorStateMachine:
     """Predict the next TTFT from the history of TTFTs."""
     if not self.ttfts:
       return 0.0
-    avg = np.mean(self.ttfts)
-    std = np.std(self.ttfts)
+    # Convert the deque once: np.mean and np.std would each copy it otherwise.
+    ttfts = np.fromiter(self.ttfts, dtype=float, count=len(self.ttfts))
+    avg = ttfts.mean()
+    std = ttfts.std()
     # Subtract the standard deviation to get a lower bound on the next TTFT.
     # Underestimating the TTFT will result in the comment being triggered too
     # late, adding a delay to the conversation but making the comment more
@@ -565,11 +639,14 @@ class LeonidasAgent(processor.Processor):
     self._processor = live_api_processor
     self._chattiness = chattiness
     self._commentator = CommentatorStateMachine()
-    # Historic time to first token (TTFT) of the recent requests.
-    # We use it request the next comment just before the current one finishes.
-    self.ttfts = collections.deque(maxlen=50)
-    self._unsafe_string_list = unsafe_string_list
+    # Message sent to the model when unsafe content is detected. It only
+    # depends on the unsafe strings, so we build it once here.
+    self._start_again_msg = None
     if unsafe_string_list is not None:
+      self._start_again_msg = START_AGAIN_MSG + (
+          ' Do not mention the following expressions in your next response:'
+          " '%s'" % "', '".join(unsafe_string_list)
+      )
       pattern = '|'.join(re.escape(s) for s in unsafe_string_list)
       self._processor += text.MatchProcessor(
           pattern=pattern,
@@ -591,7 +668,7 @@ class LeonidasAgent(processor.Processor):
       input_queue: asyncio.Queue[content_api.ProcessorPart],
       message: str = COMMENT_MSG,
       will_continue: bool = False,
-      scheduling: genai_types.FunctionResponseScheduling = genai_types.FunctionResponseScheduling.WHEN_IDLE,
+      scheduling: genai_types.FunctionResponseScheduling = _WHEN_IDLE,
   ) -> None:
     """Triggers a comment from the model. Input queue is fed to the model."""
     if self._commentator.id is None:
@@ -609,7 +686,7 @@ class LeonidasAgent(processor.Processor):
       input_queue.put_nowait(
           content_api.ProcessorPart.from_function_response(
               function_call_id=self._commentator.id,
-              name='start_commentating',
+              name=START_COMMENTATING_FN,
               response={'output': message},
               will_continue=will_continue,
               scheduling=scheduling,
@@ -623,10 +700,10 @@ class LeonidasAgent(processor.Processor):
     input_queue.put_nowait(
         content_api.ProcessorPart.from_function_response(
             function_call_id=fn_id,
-            name='start_commentating',
+            name=START_COMMENTATING_FN,
             response={},
             will_continue=False,
-            scheduling=genai_types.FunctionResponseScheduling.SILENT,
+            scheduling=_SILENT,
         )
     )
 
@@ -637,10 +714,10 @@ class LeonidasAgent(processor.Processor):
     input_queue.put_nowait(
         content_api.ProcessorPart.from_function_response(
             function_call_id=fn_id,
-            name='wait_for_user',
+            name=WAIT_FOR_USER_FN,
             response={},
             will_continue=False,
-            scheduling=genai_types.FunctionResponseScheduling.SILENT,
+            scheduling=_SILENT,
         )
     )
 
@@ -651,8 +728,6 @@ class LeonidasAgent(processor.Processor):
       message: str = COMMENT_MSG,
   ):
     """Schedules and triggers a comment from the model."""
-    if self._chattiness < 1e-6:
-      return
     # Wait for the last moment to trigger the comment. This minimizes the
     # delay between any event on the video stream and the comment.
     await asyncio.sleep(max(0, at_time - time.perf_counter()))
@@ -670,6 +745,23 @@ class LeonidasAgent(processor.Processor):
       else:
         await asyncio.sleep(NO_COMMENT_DELAY_SEC)
 
+  def _create_schedule_task(
+      self,
+      at_time: float,
+      input_queue: asyncio.Queue[content_api.ProcessorPart],
+      message: str = COMMENT_MSG,
+  ) -> asyncio.Task[None] | None:
+    """Creates the task scheduling the next comment, None if disabled."""
+    if self._chattiness < 1e-6:
+      # Proactive comments are disabled: do not create a task that would
+      # return right away.
+      return None
+    return processor.create_task(
+        self._schedule_comment(
+            at_time=at_time, input_queue=input_queue, message=message
+        )
+    )
+
   async def call(
       self, content: AsyncIterable[content_api.ProcessorPart]
   ) -> AsyncIterable[content_api.ProcessorPart]:
@@ -688,14 +780,18 @@ class LeonidasAgent(processor.Processor):
     )
 
     start_time = time.perf_counter()
+    next_status_log_time = start_time
     async for part in self._processor(input_stream):
-      logging.log_every_n_seconds(
-          logging.INFO,
-          '%s - commentator running for: %s',
-          10,
-          time.perf_counter(),
-          timestamp.to_timestamp(time.perf_counter() - start_time),
-      )
+      # Only build the status message when it is due: this runs for every
+      # part, including each audio chunk.
+      now = time.perf_counter()
+      if now >= next_status_log_time:
+        next_status_log_time = now + STATUS_LOG_INTERVAL_SEC
+        logging.info(
+            '%s - commentator running for: %s',
+            now,
+            timestamp.to_timestamp(now - start_time),
+        )
 
       # Handle unsafe content.
       if part.substream_name == 'unsafe_regex':
@@ -707,12 +803,7 @@ class LeonidasAgent(processor.Processor):
         self._commentator.update(Action.REQUEST_FROM_USER)
         input_queue.put_nowait(
             content_api.ProcessorPart(
-                START_AGAIN_MSG
-                + (
-                    ' Do not mention the following expressions in your'
-                    " next response: '%s'"
-                    % "', '".join(self._unsafe_string_list)
-                ),
+                self._start_again_msg,
                 role='USER',
                 substream_name='realtime',
             )
@@ -727,7 +818,7 @@ class LeonidasAgent(processor.Processor):
             part,
         )
         fn_id = part.get_metadata('id')
-        if part.part.function_call.name == 'start_commentating':
+        if part.part.function_call.name == START_COMMENTATING_FN:
           if self._commentator.state != State.OFF:
             # We already have a comment in progress, ignore this one.
             logging.info(
@@ -738,7 +829,7 @@ class LeonidasAgent(processor.Processor):
             self._stop_commentating(input_queue, fn_id)
           else:
             self._commentator.update(Action.TURN_ON, fn_id)
-        elif part.part.function_call.name == 'wait_for_user':
+        elif part.part.function_call.name == WAIT_FOR_USER_FN:
           if self._commentator.state != State.OFF:
             logging.debug(
                 '%s - Received wait_for_user: %s',
@@ -757,13 +848,10 @@ class LeonidasAgent(processor.Processor):
                   time.perf_counter(),
               )
               tentative_trigger_time = time.perf_counter()
-            schedule_task = processor.create_task(
-                self._schedule_comment(
-                    at_time=tentative_trigger_time
-                    + MAX_SILENCE_WAIT_FOR_USER_SEC,
-                    input_queue=input_queue,
-                    message=INTERRUPT_WAIT_FOR_USER_MSG,
-                )
+            schedule_task = self._create_schedule_task(
+                at_time=tentative_trigger_time + MAX_SILENCE_WAIT_FOR_USER_SEC,
+                input_queue=input_queue,
+                message=INTERRUPT_WAIT_FOR_USER_MSG,
             )
         continue
 
@@ -799,20 +887,15 @@ class LeonidasAgent(processor.Processor):
           tentative_trigger_time = self._commentator.tentative_trigger_time()
           if self._commentator.state != State.WAITING_FOR_USER:
             # Schedule the next commentator turn.
-            schedule_task = processor.create_task(
-                self._schedule_comment(
-                    at_time=tentative_trigger_time,
-                    input_queue=input_queue,
-                )
+            schedule_task = self._create_schedule_task(
+                at_time=tentative_trigger_time,
+                input_queue=input_queue,
             )
           else:
-            schedule_task = processor.create_task(
-                self._schedule_comment(
-                    at_time=tentative_trigger_time
-                    + MAX_SILENCE_WAIT_FOR_USER_SEC,
-                    input_queue=input_queue,
-                    message=INTERRUPT_WAIT_FOR_USER_MSG,
-                )
+            schedule_task = self._create_schedule_task(
+                at_time=tentative_trigger_time + MAX_SILENCE_WAIT_FOR_USER_SEC,
+                input_queue=input_queue,
+                message=INTERRUPT_WAIT_FOR_USER_MSG,
             )
 
       # Handle interruption from the user.
@@ -843,7 +926,7 @@ class LeonidasAgent(processor.Processor):
               input_queue,
               message=response,
               will_continue=True,
-              scheduling=genai_types.FunctionResponseScheduling.INTERRUPT,
+              scheduling=_INTERRUPT,
           )
 
       if part.get_metadata('go_away'):
@@ -901,13 +984,7 @@ def create_leonidas_agent(
   event_detection_processor = event_detection.EventDetection(
       api_key=api_key,
       model=MODEL_DETECTION,
-      config=genai_types.GenerateContentConfig(
-          system_instruction=EVENT_DETECTION_PROMPT,
-          max_output_tokens=10,
-          response_mime_type='text/x.enum',
-          response_schema=EventTypes,
-          media_resolution=MEDIA_RESOLUTION,
-      ),
+      config=_EVENT_DETECTION_CONFIG,
       output_dict={
           ('*', EventTypes.DETECTION): [
               content_api.ProcessorPart(
@@ -947,19 +1024,7 @@ def create_leonidas_agent(
   live_api_processor = live_model.LiveProcessor(
       api_key=api_key,
       model_name=MODEL_LIVE,
-      realtime_config=genai_types.LiveConnectConfig(
-          tools=TOOLS,
-          system_instruction=LEONIDAS_PROMPT_PARTS,
-          output_audio_transcription={},
-          realtime_input_config=genai_types.RealtimeInputConfig(
-              turn_coverage='TURN_INCLUDES_ALL_INPUT'
-          ),
-          response_modalities=['AUDIO'],
-          speech_config={'language_code': 'pt-BR'},
-          generation_config=genai_types.GenerationConfig(
-              media_resolution=MEDIA_RESOLUTION
-          ),
-      ),
+      realtime_config=_LIVE_CONNECT_CONFIG,
       http_options=genai_types.HttpOptions(api_version='v1alpha'),
   )
   return (